@@ -1,10 +1,56 @@
-from asyncio import TimeoutError, coroutine, sleep, wait_for
+import random
+import time
+from asyncio import TimeoutError, sleep, wait_for
 
 from karabo.middlelayer import (
     AccessMode, Bool, Device, Int32, Slot, State, background, connectDevice,
     isAlive, waitUntilNew)
 
 REMOTE_DEVICE = "remote_server1/remote_dev0"
+RECONNECT_DELAY = 1.0
+RECONNECT_DELAY_MAX = 30.0
+WATCHDOG_INTERVAL = 1.0
+WATCHDOG_INTERVAL_MAX = 15.0
+
+# Failed connection attempts per device id: (time of next attempt, failures)
+_CONNECT_FAILURE_CACHE = {}
+
+
+class ConnectionSkipped(Exception):
+    """A connection attempt was skipped as a previous attempt failed
+
+    `retry_in` is the time in seconds until the next attempt is allowed.
+    """
+
+    def __init__(self, deviceId, retry_in):
+        super().__init__(deviceId, retry_in)
+        self.retry_in = retry_in
+
+
+async def _connect_remote(deviceId, timeout=2):
+    """Connect to `deviceId`, shared by all devices of this server
+
+    After a failure, further attempts raise `ConnectionSkipped` without
+    contacting the broker until the backoff of the failure has expired.
+    """
+    expiry, _ = _CONNECT_FAILURE_CACHE.get(deviceId, (0.0, 0))
+    now = time.monotonic()
+    if now < expiry:
+        raise ConnectionSkipped(deviceId, expiry - now)
+    try:
+        device = await wait_for(connectDevice(deviceId), timeout=timeout)
+    except TimeoutError:
+        # Other devices may have connected or failed while we were waiting
+        _, failures = _CONNECT_FAILURE_CACHE.get(deviceId, (0.0, 0))
+        failures += 1
+        # Clamp the exponent, 2 ** 5 already exceeds `RECONNECT_DELAY_MAX`
+        backoff = min(RECONNECT_DELAY * 2 ** min(failures - 1, 5),
+                      RECONNECT_DELAY_MAX)
+        _CONNECT_FAILURE_CACHE[deviceId] = (
+            time.monotonic() + backoff, failures)
+        raise
+    _CONNECT_FAILURE_CACHE.pop(deviceId, None)
+    return device
 
 
 class MonitorRemote(Device):
@@ -32,10 +78,9 @@ class MonitorRemote(Device):
         self.state = State.INIT
         self.device = None
 
-    @coroutine
-    def onInitialization(self):
+    async def onInitialization(self):
         self.status = "Waiting for external device"
-        self.device = yield from connectDevice(REMOTE_DEVICE)
+        self.device = await connectDevice(REMOTE_DEVICE)
         self.status = "Connection established"
 
         background(self.watchdog())
@@ -44,25 +89,60 @@ class MonitorRemote(Device):
     @Slot(displayedName="Start",
           description="Start monitoring the remote device",
           allowedStates={State.STOPPED})
-    @coroutine
-    def start(self):
+    async def start(self):
         self.state = State.STARTED
         while self.state != State.STOPPED:
-            self.remoteValue = self.device.x
-            yield from waitUntilNew(self.device.x)
+            # The value read from the proxy is also the reference for
+            # `waitUntilNew`, so the proxy is read once per change. The
+            # proxy is looked up again every time, as a reconnect replaces it
+            value = self.device.x
+            self.remoteValue = value
+            await waitUntilNew(value)
 
     @Slot(displayedName="Stop",
           description="Stop monitoring the remote device",
           allowedStates={State.STARTED})
-    @coroutine
-    def stop(self):
+    async def stop(self):
         self.state = State.STOPPED
 
-    @coroutine
-    def watchdog(self):
+    async def watchdog(self):
+        """Watch the remote device and reconnect if it is gone
+
+        The check interval grows while the remote device stays alive and
+        falls back to `WATCHDOG_INTERVAL` after a failure.
+        """
+        interval = WATCHDOG_INTERVAL
         while True:
-            if not isAlive(self.device):
+            await sleep(interval)
+            if isAlive(self.device):
+                interval = min(interval * 1.5, WATCHDOG_INTERVAL_MAX)
+            else:
+                interval = WATCHDOG_INTERVAL
                 self.reconnecting = True
                 self.state = State.INIT
-            yield from sleep(5)
+                await self.reconnectDevice()
+
+    async def reconnectDevice(self):
+        """Reconnect to the remote device
+
+        The delay between two attempts grows exponentially up to
+        `RECONNECT_DELAY_MAX` and is jittered, so that many devices losing
+        the same remote do not all hit the broker at once.
+        """
+        delay = RECONNECT_DELAY
+        while self.reconnecting:
+            try:
+                self.device = await _connect_remote(REMOTE_DEVICE)
+                delay = RECONNECT_DELAY
+                self.reconnecting = False
+                self.status = "Connection established"
+                self.state = State.STOPPED
+            except ConnectionSkipped as e:
+                # The broker was not contacted, keep our own backoff
+                self.status = "Waiting for external device"
+                await sleep(e.retry_in)
+            except TimeoutError:
+                self.status = "Waiting for external device"
+                await sleep(delay + random.uniform(0, delay * 0.25))
+                delay = min(delay * 2, RECONNECT_DELAY_MAX)
 
@@ -33,12 +33,10 @@ class MotorDevice(Device):
         h = Hash("targetPosition", 4.2,
                  "velocity", QuantityValue(4.2, timestamp=minutesAgo(2)),
                  "node.filterPosition", 2)
-        # 1. All values will be applied only if they changed
+        # Values will be applied only if they changed. Omitting
+        # `only_changes` applies all values again, e.g. `self.set(h)`
         self.set(h, only_changes=True)
 
-        # 2. All values will be applied
-        self.set(h)
-
         h = Hash("targetPosition", 4.2,
                  "velocity", QuantityValue(100.2, timestamp=minutesAgo(2)),
                  "node.filterPosition", 12)
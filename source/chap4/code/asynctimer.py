@@ -31,8 +31,9 @@ class StackedStatus(Device):
         self.status_timer.start()
 
     async def _timer_callback(self):
-        self.status = "\n".join(self.stacked_status)
-        self.stacked_status = []
+        # Take the cached statuses and start a new list for later posts
+        pending, self.stacked_status = self.stacked_status, []
+        self.status = "\n".join(pending)
         self.update()
 
     async def onDestruction(self):
@@ -42,8 +43,9 @@ class StackedStatus(Device):
 class QueueStatus(Device):
     """This is a device that has a lot of status updates.
 
-    In this example, a status list is continously emptied with a status
-    throttle time of `STATUS_THROTTLE`
+    In this example, a status queue is continously emptied with a status
+    throttle time of `STATUS_THROTTLE`. All statuses queued since the last
+    tick are sent out with a single update.
     """
 
     async def onInitialization(self):
@@ -59,7 +61,8 @@ class QueueStatus(Device):
 
     async def _timer_callback(self):
         if self.status_queue:
-            self.status = self.status_queue.pop(0)
+            pending, self.status_queue = self.status_queue, []
+            self.status = "\n".join(pending)
             # Potential check for status changes before setting
             self.update()
 
@@ -1,4 +1,6 @@
-from karabo.middlelayer import Device, Int32, String, waitUntil
+import weakref
+
+from karabo.middlelayer import Device, Int32, KaraboError, String, waitUntil
 
 
 class Motor(Device):
@@ -8,17 +10,38 @@ class Motor(Device):
     controllerId = String()
     channelId = Int32(defaultValue=1)
 
+    def __init__(self, configuration):
+        super().__init__(configuration)
+        # Weak reference, the controller may be shut down independently
+        self._controller = None
+
     async def onInitialization(self):
         """This method is executed on instantiation"""
+        # Wait until the controller is online on the same server
+        await waitUntil(lambda: self.getLocalDevice(
+            self.controllerId.value) is not None)
+        await self.read_values()
 
-        def is_online():
-            return self.getLocalDevice(self.controllerId.value) is not None
+    def get_controller(self):
+        """Return the controller device, resolve it again if it is gone"""
+        controller = None
+        if self._controller is not None:
+            controller = self._controller()
+        if controller is None:
+            controller = self.getLocalDevice(self.controllerId.value)
+            if controller is None:
+                raise KaraboError(
+                    f"Controller {self.controllerId.value} is not online")
+            self._controller = weakref.ref(controller)
+        return controller
 
-        await waitUntil(lambda: is_online)
-        # A bit less readable example with 2 lambdas
-        await waitUntil(lambda: lambda: self.getLocalDevice(
-            self.controllerId.value) is not None)
-        # Strong reference to the controller device
-        controller = self.getLocalDevice(self.controllerId.value)
-        # Call a function directly on the device object
-        values = await controller.read_hardware_values(self.channelId)
+    async def read_values(self):
+        """Read the hardware values via the controller device"""
+        controller = self.get_controller()
+        try:
+            # Call a function directly on the device object
+            return await controller.read_hardware_values(self.channelId)
+        except Exception:
+            # Do not keep a reference that failed, resolve it on next read
+            self._controller = None
+            raise
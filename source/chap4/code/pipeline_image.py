@@ -2,8 +2,11 @@ from asyncio import sleep
 
 import numpy as np
 from karabo.middlelayer import (
-    AccessMode, Configurable, DaqDataType, Device, Image, Int32, Node,
-    OutputChannel, Slot, State, UInt8, UInt32, background)
+    AccessMode, AsyncTimer, Configurable, DaqDataType, Device, Image, Int32,
+    Node, OutputChannel, Slot, State, UInt8, UInt32, background)
+
+IMAGE_SHAPE = (800, 600)
+COUNTER_UPDATE = 1
 
 
 def channelSchema(dtype):
@@ -14,7 +17,7 @@ def channelSchema(dtype):
 
         image = Image(displayedName="Image",
                       dtype=dtype,
-                      shape=(800, 600))
+                      shape=IMAGE_SHAPE)
 
     class ChannelNode(Configurable):
         data = Node(DataNode)
@@ -39,10 +42,16 @@ class ImageMDL(Device):
     def __init__(self, configuration):
         super(ImageMDL, self).__init__(configuration)
         self._dtype = UInt32
+        self._rng = np.random.default_rng()
+        self._send_count = 0
 
     async def onInitialization(self):
         self.state = State.ON
         self._acquiring = False
+        # The counter is published periodically and not for every frame
+        self.counter_timer = AsyncTimer(
+            self._counter_callback, timeout=COUNTER_UPDATE)
+        self.counter_timer.start()
         background(self._network_action())
 
     @Slot(allowedStates=[State.ACQUIRING])
@@ -57,6 +66,7 @@ class ImageMDL(Device):
 
     @Slot(displayedName="Reset Counter")
     async def resetCounter(self):
+        self._send_count = 0
         self.imageSend = 0
 
     @Slot(displayedName="Send EndOfStream", allowedStates=[State.ON])
@@ -78,12 +88,16 @@ class ImageMDL(Device):
             if self._acquiring:
                 output = self.output.schema.data
                 # Descriptor classes have `numpy` property
-                dtype = self._dtype.numpy
-                image_array = np.random.randint(
-                    0, 255, size=(800, 600),
-                    dtype=dtype)
-                output.image = image_array
-                self.imageSend = self.imageSend.value + 1
+                output.image = self._rng.integers(
+                    0, 255, size=IMAGE_SHAPE, dtype=self._dtype.numpy)
+                self._send_count += 1
                 await self.output.writeData()
 
             await sleep(1 / self.frequency.value)
+
+    async def _counter_callback(self):
+        if self.imageSend != self._send_count:
+            self.imageSend = self._send_count
+
+    async def onDestruction(self):
+        self.counter_timer.stop()